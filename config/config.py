@@ -13,12 +13,35 @@ class Config:
     # GitHub configuration
     GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
     GITHUB_API_URL = "https://api.github.com/user/repos"
+    GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
 
     # Application configuration
     CHECK_INTERVAL = 300  # 5 minutes in seconds
+    TRACKED_METRICS = [
+        name.strip()
+        for name in os.getenv(
+            "TRACKED_METRICS", "stars,forks,watchers,open_issues,releases"
+        ).split(",")
+        if name.strip()
+    ]
+    METRIC_FETCH_CONCURRENCY = 10  # Simultaneous per-repository requests
+    METRIC_BATCH_SIZE = 50  # Repositories per batched GraphQL request
     DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
     REPOSITORIES_FILE = os.path.join(DATA_DIR, "repositories.json")
 
+    # Stargazer profile enrichment configuration
+    PROFILES_FILE = os.path.join(DATA_DIR, "profiles.json")
+    PROFILE_CACHE_TTL = 86400  # 24 hours in seconds
+    PROFILE_CACHE_SIZE = 5000  # Maximum number of cached profiles
+    PROFILE_BATCH_SIZE = 50  # Profiles fetched per GraphQL request
+    PROFILE_BATCH_DELAY = 1  # Seconds to wait while collecting a batch
+    NOTABLE_FOLLOWERS = 1000  # Followers needed to be a notable account
+
+    # Profiling configuration
+    PROFILING_CYCLES = 3  # Monitor cycles profiled per request
+    ADMIN_HOST = "127.0.0.1"
+    ADMIN_PORT = int(os.getenv("ADMIN_PORT", "0"))  # 0 disables the endpoint
+
     @staticmethod
     def ensure_directories():
         """Ensure all required directories exist."""
@@ -1,9 +1,13 @@
 import asyncio
 import os
+import signal
+from aiohttp import web
 from services.github_api import GitHubAPI
 from services.discord_bot import DiscordBot
+from services.metrics import MetricEngine
 from config.config import Config
 from utils.logger import setup_logger
+from utils.profiler import MonitorProfiler
 
 # Set up logger
 logger = setup_logger("main")
@@ -13,6 +17,9 @@ class GitHubStarMonitor:
     def __init__(self):
         self.github_api = GitHubAPI()
         self.discord_bot = DiscordBot(self.github_api)
+        self.metric_engine = MetricEngine(self.github_api)
+        self.profiler = MonitorProfiler()
+        self.admin_runner = None
         self.running = False
 
     async def start(self):
@@ -20,6 +27,9 @@ class GitHubStarMonitor:
         self.running = True
         logger.info("Starting GitHub Star Monitor")
 
+        self.setup_profiling_signals()
+        await self.start_admin_server()
+
         # Start Discord bot in a separate task
         discord_task = asyncio.create_task(self.run_discord_bot())
 
@@ -35,9 +45,65 @@ class GitHubStarMonitor:
             logger.error(f"Error in main process: {e}")
         finally:
             self.running = False
+            self.profiler.shutdown()
+            if self.admin_runner:
+                await self.admin_runner.cleanup()
             await self.github_api.close_session()
             logger.info("Monitor stopped.")
 
+    def setup_profiling_signals(self):
+        """Profile on SIGUSR1 and dump asyncio task stacks on SIGUSR2."""
+        if not hasattr(signal, "SIGUSR1"):
+            logger.info("Profiling signals are not supported on this platform")
+            return
+
+        loop = asyncio.get_running_loop()
+        loop.add_signal_handler(
+            signal.SIGUSR1, self.profiler.request, Config.PROFILING_CYCLES
+        )
+        loop.add_signal_handler(signal.SIGUSR2, self.profiler.dump_tasks)
+        logger.info("Send SIGUSR1 to profile monitor cycles, SIGUSR2 to dump tasks")
+
+    async def start_admin_server(self):
+        """Start the local admin endpoint used to trigger profiling."""
+        if not Config.ADMIN_PORT:
+            return
+
+        async def profile(request):
+            try:
+                cycles = int(request.query.get("cycles", Config.PROFILING_CYCLES))
+            except ValueError:
+                return web.Response(status=400, text="cycles must be an integer\n")
+            if cycles < 1:
+                return web.Response(status=400, text="cycles must be at least 1\n")
+            self.profiler.request(cycles)
+            return web.Response(text=f"Profiling the next {cycles} cycle(s)\n")
+
+        async def tasks(request):
+            path = self.profiler.dump_tasks()
+            return web.Response(text=f"Task stacks written to {path}\n")
+
+        app = web.Application()
+        app.router.add_post("/profile", profile)
+        app.router.add_post("/tasks", tasks)
+
+        self.admin_runner = web.AppRunner(app)
+        await self.admin_runner.setup()
+        try:
+            await web.TCPSite(
+                self.admin_runner, Config.ADMIN_HOST, Config.ADMIN_PORT
+            ).start()
+        except OSError as e:
+            # The endpoint is optional, so keep monitoring without it
+            logger.error(f"Could not start admin endpoint: {e}")
+            await self.admin_runner.cleanup()
+            self.admin_runner = None
+            return
+
+        logger.info(
+            f"Admin endpoint listening on http://{Config.ADMIN_HOST}:{Config.ADMIN_PORT}"
+        )
+
     async def run_discord_bot(self):
         """Run the Discord bot."""
         try:
@@ -47,8 +113,8 @@ class GitHubStarMonitor:
             self.running = False
 
     async def monitor_github_stars(self):
-        """Monitor GitHub repositories for star changes."""
-        logger.info("Starting GitHub star monitoring with 5-minute intervals")
+        """Monitor GitHub repositories for changes of the tracked metrics."""
+        logger.info("Starting GitHub monitoring with 5-minute intervals")
 
         # Initial load of repository data
         old_repos = self.github_api.load_repositories_data()
@@ -57,48 +123,63 @@ class GitHubStarMonitor:
         if not old_repos:
             logger.info("No existing repository data found. Fetching initial data...")
             raw_repos = await self.github_api.get_all_public_repositories()
-            old_repos = self.github_api.parse_repository_data(raw_repos)
-            old_repos = await self.github_api.update_stargazers_for_repos(old_repos)
-            await self.github_api.save_repositories_data(old_repos)
-            logger.info(f"Initialized data for {len(old_repos)} repositories")
+            if raw_repos is None:
+                logger.error(
+                    "Failed to fetch initial repository data, retrying on the next check"
+                )
+                old_repos = []
+            else:
+                old_repos = await self.metric_engine.collect(raw_repos)
+                await self.github_api.save_repositories_data(old_repos)
+                logger.info(f"Initialized data for {len(old_repos)} repositories")
 
         while self.running:
             try:
-                logger.info("Checking for star changes...")
+                logger.info("Checking for changes...")
+                self.profiler.start_cycle()
 
-                # Fetch the latest repository data
+                # Fetch the latest repository data with every tracked metric
                 raw_repos = await self.github_api.get_all_public_repositories()
-                new_repos = self.github_api.parse_repository_data(raw_repos)
+                if raw_repos is None:
+                    # Keep the previous data rather than saving a partial listing
+                    logger.error("Failed to fetch repositories, skipping this check")
+                    self.profiler.end_cycle(old_repos=old_repos)
+                    await asyncio.sleep(Config.CHECK_INTERVAL)
+                    continue
 
-                # Update stargazers for each repository
-                new_repos = await self.github_api.update_stargazers_for_repos(new_repos)
+                new_repos = await self.metric_engine.collect(raw_repos, old_repos)
 
-                # Compare star counts
-                changes = self.github_api.compare_stars(old_repos, new_repos)
+                # Compare tracked metrics
+                changes = self.metric_engine.compare(old_repos, new_repos)
 
                 # Process changes
                 if changes:
                     logger.info(f"Found {len(changes)} changes to process")
                     for change in changes:
                         repo_name = change["repo"]["full_name"]
-                        if change["type"] == "added":
+                        if change["type"] == "new":
+                            logger.info(f"Detected new repository: {repo_name}")
+                            continue
+
+                        metric = change["metric"]
+                        if change["type"] == "released":
                             logger.info(
-                                f"Detected {change['difference']} new star(s) for {repo_name}"
+                                f"Detected new release {change['release']['tag']} for {repo_name}"
                             )
-                            await self.discord_bot.send_star_update(change)
-                        elif change["type"] == "removed":
+                        else:
                             logger.info(
-                                f"Detected {change['difference']} removed star(s) for {repo_name}"
+                                f"Detected {change['difference']} {change['type']} {metric.name} for {repo_name}"
                             )
-                            await self.discord_bot.send_star_update(change)
-                        elif change["type"] == "new":
-                            logger.info(f"Detected new repository: {repo_name}")
-
-                    # Save the updated repository data
-                    await self.github_api.save_repositories_data(new_repos)
-                    old_repos = new_repos
+                        await self.discord_bot.send_update(change)
                 else:
-                    logger.info("No star changes detected")
+                    logger.info("No changes detected")
+
+                self.profiler.end_cycle(old_repos=old_repos, new_repos=new_repos)
+
+                # Save the updated repository data, which also records metrics
+                # that were not tracked yet when the data was last saved
+                await self.github_api.save_repositories_data(new_repos)
+                old_repos = new_repos
 
                 # Wait before checking again
                 logger.info(
@@ -111,6 +192,7 @@ class GitHubStarMonitor:
                 break
             except Exception as e:
                 logger.error(f"Error while monitoring GitHub stars: {e}")
+                self.profiler.end_cycle(old_repos=old_repos)
                 await asyncio.sleep(Config.CHECK_INTERVAL)
 
 
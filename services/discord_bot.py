@@ -3,6 +3,7 @@ import datetime
 import random
 import asyncio
 from config.config import Config
+from services.profile_enricher import ProfileEnricher
 from utils.logger import setup_logger
 
 logger = setup_logger("discord_bot")
@@ -13,6 +14,8 @@ class DiscordBot:
         self.client = discord.Client(intents=discord.Intents.default())
         self.channel = None
         self.github_api = github_api
+        self.profile_enricher = ProfileEnricher(github_api)
+        self.enrichment_tasks = set()
 
         # Thank you messages for new stars
         self.thank_you_messages = [
@@ -52,6 +55,66 @@ class DiscordBot:
 
         await self.client.start(Config.DISCORD_TOKEN)
 
+    async def send_update(self, change):
+        """Send the notification matching the metric of a change."""
+        if change["metric"].name == "stars":
+            await self.send_star_update(change)
+        else:
+            await self.send_metric_update(change)
+
+    async def send_metric_update(self, change):
+        """Send a formatted embed message about a change of a tracked metric."""
+        if not self.channel:
+            logger.error("Discord channel not found, can't send message")
+            return
+
+        repo = change["repo"]
+        metric = change["metric"]
+        logger.info(
+            f"Preparing to send {metric.name} notification for {repo['full_name']}"
+        )
+
+        embed = discord.Embed(
+            title=f"{metric.label} Update for {repo['name']}",
+            url=repo["url"],
+            color=self.get_embed_color(change["type"]),
+            timestamp=datetime.datetime.utcnow(),
+        )
+
+        # Set the repository thumbnail
+        embed.set_thumbnail(url=f"https://github.com/fluidicon.png")
+
+        # Add repository information
+        embed.add_field(
+            name="Repository",
+            value=f"[{repo['full_name']}]({repo['url']})",
+            inline=False,
+        )
+
+        if change["type"] == "released":
+            release = change["release"]
+            embed.description = f"{metric.emoji} **New Release: [{release['name']}]({release['url']})**"
+            embed.add_field(name="Tag", value=release["tag"], inline=True)
+        else:
+            direction = "Added" if change["type"] == "added" else "Removed"
+            embed.description = f"{metric.emoji} **{metric.label} {direction}: {change['difference']}**"
+            embed.add_field(
+                name=metric.label,
+                value=f"{metric.emoji} {change['old_value']} → **{change['new_value']}**",
+                inline=True,
+            )
+
+        # Add footer with timestamp info
+        embed.set_footer(
+            text=f"Created: {self.format_date(repo['created_at'])} | Last updated: {self.format_date(repo['updated_at'])}"
+        )
+
+        try:
+            await self.channel.send(embed=embed)
+            logger.info(f"Successfully sent {metric.name} notification for {repo['name']}")
+        except Exception as e:
+            logger.error(f"Failed to send {metric.name} update: {e}")
+
     async def send_star_update(self, change):
         """Send a formatted embed message about star changes."""
         if not self.channel:
@@ -224,13 +287,73 @@ class DiscordBot:
             text=f"Created: {self.format_date(repo['created_at'])} | Last updated: {self.format_date(repo['updated_at'])}"
         )
 
+        # Enrich with stargazer profiles straight away when they are all cached
+        users = change.get("users", [])[: change.get("difference", 1)]
+        logins = [user["username"] for user in users]
+        profiles = self.profile_enricher.get_cached(logins)
+        if len(profiles) == len(logins):
+            self.add_profile_fields(embed, users, profiles)
+
         try:
-            await self.channel.send(embed=embed)
+            message = await self.channel.send(embed=embed)
             logger.info(
                 f"Successfully sent star update notification for {repo['name']}"
             )
         except Exception as e:
             logger.error(f"Failed to send star update: {e}")
+            return
+
+        # Otherwise don't hold the notification back, edit it once profiles arrive
+        if len(profiles) < len(logins):
+            task = asyncio.create_task(self.enrich_star_update(message, embed, users))
+            self.enrichment_tasks.add(task)
+            task.add_done_callback(self.enrichment_tasks.discard)
+
+    async def enrich_star_update(self, message, embed, users):
+        """Edit a sent star update once its stargazer profiles are fetched."""
+        try:
+            profiles = await self.profile_enricher.get_profiles(
+                [user["username"] for user in users]
+            )
+            if not self.add_profile_fields(embed, users, profiles):
+                return
+
+            await message.edit(embed=embed)
+            logger.info(f"Enriched star update with {len(profiles)} profile(s)")
+        except Exception as e:
+            logger.error(f"Failed to enrich star update: {e}")
+
+    def add_profile_fields(self, embed, users, profiles):
+        """Add follower count, company and notability of stargazers to the embed."""
+        lines = []
+        for user in users:
+            profile = profiles.get(user["username"])
+            if not profile:
+                continue
+
+            details = [f"👥 {profile['followers']} followers"]
+            if profile.get("company"):
+                details.append(f"🏢 {profile['company']}")
+            if (
+                profile["followers"] >= Config.NOTABLE_FOLLOWERS
+                or profile.get("github_star")
+            ):
+                details.append("🏅 Notable account")
+
+            if len(users) == 1:
+                lines.append(" | ".join(details))
+            else:
+                lines.append(f"• **{user['username']}**: " + " | ".join(details))
+
+        if not lines:
+            return False
+
+        embed.add_field(
+            name="Stargazer Profile" if len(users) == 1 else "Stargazer Profiles",
+            value="\n".join(lines)[:1024],
+            inline=False,
+        )
+        return True
 
     def get_embed_color(self, change_type):
         """Get the appropriate color for the embed based on the change type."""
@@ -1,6 +1,7 @@
 import json
 import aiohttp
 import os
+from urllib.parse import urlencode
 from config.config import Config
 from utils.logger import setup_logger
 
@@ -16,6 +17,9 @@ class GitHubAPI:
         }
         self.session = None
 
+        # Parsed responses kept for revalidation with their ETags
+        self.etag_cache = {}
+
         # Ensure data directory exists
         Config.ensure_directories()
 
@@ -29,7 +33,11 @@ class GitHubAPI:
             self.session = None
 
     async def get_all_public_repositories(self):
-        """Fetch all public repositories, handling pagination."""
+        """Fetch all public repositories, handling pagination.
+
+        Returns None if any page fails, so a partial listing is never mistaken
+        for repositories having been deleted.
+        """
         await self.start_session()
 
         repositories = []
@@ -52,7 +60,7 @@ class GitHubAPI:
                         logger.error(
                             f"Error fetching repositories: {response.status} - {await response.text()}"
                         )
-                        break
+                        return None
 
                     repos_page = await response.json()
                     if not repos_page:
@@ -71,55 +79,103 @@ class GitHubAPI:
                     page += 1
             except Exception as e:
                 logger.error(f"Exception while fetching repositories: {e}")
-                break
+                return None
 
         return repositories
 
-    async def get_all_stargazers(self, repo_full_name):
-        """Get all users who starred the repository."""
+    async def request_json(self, url, params=None, parse=None):
+        """Fetch a JSON resource, revalidating the previous response with its ETag.
+
+        Only the parsed result is kept alongside the ETag, so parse should
+        reduce the response to the fields the caller needs.
+        """
         await self.start_session()
 
+        request_key = f"{url}?{urlencode(sorted((params or {}).items()))}"
+        headers = dict(self.headers)
+        cached = self.etag_cache.get(request_key)
+        if cached:
+            # Unchanged resources answer 304, which does not count against the rate limit
+            headers["If-None-Match"] = cached["etag"]
+
+        try:
+            async with self.session.get(
+                url, headers=headers, params=params
+            ) as response:
+                if response.status == 304 and cached:
+                    return 200, cached["data"]
+
+                if response.status != 200:
+                    return response.status, None
+
+                data = await response.json()
+                if parse:
+                    data = parse(data)
+
+                etag = response.headers.get("ETag")
+                if etag:
+                    self.etag_cache[request_key] = {"etag": etag, "data": data}
+                return 200, data
+        except Exception as e:
+            logger.error(f"Exception while fetching {url}: {e}")
+            return None, None
+
+    async def get_watcher_count(self, repo_full_name):
+        """Get the number of users watching a repository."""
+        url = f"https://api.github.com/repos/{repo_full_name}"
+        status, watchers = await self.request_json(
+            url, parse=lambda repo: repo["subscribers_count"]
+        )
+
+        if status != 200:
+            logger.error(f"Error fetching repository {repo_full_name}: {status}")
+            return None
+
+        return watchers
+
+    async def get_latest_release(self, repo_full_name):
+        """Get the latest release of a repository, or an empty dict if it has none."""
+        url = f"https://api.github.com/repos/{repo_full_name}/releases/latest"
+        status, release = await self.request_json(url, parse=self.parse_release)
+
+        if status == 404:
+            return {}
+        if status != 200:
+            logger.error(f"Error fetching latest release for {repo_full_name}: {status}")
+            return None
+
+        return release
+
+    async def get_all_stargazers(self, repo_full_name):
+        """Get all users who starred the repository, or None if the crawl failed."""
         stargazers = []
         page = 1
         per_page = 100
 
         while True:
-            try:
-                url = f"https://api.github.com/repos/{repo_full_name}/stargazers"
-                params = {"per_page": per_page, "page": page}
+            url = f"https://api.github.com/repos/{repo_full_name}/stargazers"
+            params = {"per_page": per_page, "page": page}
 
-                async with self.session.get(
-                    url, headers=self.headers, params=params
-                ) as response:
-                    if response.status == 200:
-                        stargazers_data = await response.json()
-                        if not stargazers_data:
-                            break
-
-                        page_stargazers = [
-                            {
-                                "username": user["login"],
-                                "profile": user["html_url"],
-                                "avatar": user["avatar_url"],
-                            }
-                            for user in stargazers_data
-                        ]
-                        stargazers.extend(page_stargazers)
-
-                        # Check if we need to paginate more
-                        if len(stargazers_data) < per_page:
-                            break
-
-                        page += 1
-                    else:
-                        logger.error(
-                            f"Error fetching stargazers: {response.status} - {await response.text()}"
-                        )
-                        break
-            except Exception as e:
-                logger.error(f"Exception while fetching stargazers: {e}")
+            status, page_stargazers = await self.request_json(
+                url, params, parse=self.parse_stargazers
+            )
+            if status != 200:
+                logger.error(
+                    f"Error fetching stargazers for {repo_full_name}: {status}"
+                )
+                return None
+
+            if not page_stargazers:
+                break
+
+            stargazers.extend(page_stargazers)
+
+            # Check if we need to paginate more
+            if len(page_stargazers) < per_page:
                 break
 
+            page += 1
+
         return stargazers
 
     async def get_recent_stargazers(self, repo_full_name, count=5):
@@ -153,6 +209,143 @@ class GitHubAPI:
 
         return stargazers
 
+    async def get_user_profiles(self, logins):
+        """Fetch profile details for several users in a single GraphQL request."""
+        await self.start_session()
+
+        profiles = {}
+        if not logins:
+            return profiles
+
+        # Alias one user lookup per login so the whole batch costs one request
+        variables = {f"l{index}": login for index, login in enumerate(logins)}
+        definitions = ", ".join(f"${name}: String!" for name in variables)
+        selections = " ".join(
+            f"u{index}: user(login: ${name}) "
+            "{ login company isGitHubStar followers { totalCount } }"
+            for index, name in enumerate(variables)
+        )
+        query = f"query({definitions}) {{ {selections} }}"
+
+        try:
+            async with self.session.post(
+                Config.GITHUB_GRAPHQL_URL,
+                headers=self.headers,
+                json={"query": query, "variables": variables},
+            ) as response:
+                if response.status != 200:
+                    logger.error(
+                        f"Error fetching user profiles: {response.status} - {await response.text()}"
+                    )
+                    return profiles
+
+                result = await response.json()
+                data = result.get("data")
+                if data is None:
+                    # Rate limits and query errors come back as 200 without data
+                    logger.error(
+                        f"Error fetching user profiles: {result.get('errors')}"
+                    )
+                    return profiles
+
+                # A null alias can also mean a transient error on that lookup,
+                # only errors typed NOT_FOUND mean the account doesn't exist
+                not_found = {
+                    error["path"][0]
+                    for error in result.get("errors") or []
+                    if error.get("type") == "NOT_FOUND" and error.get("path")
+                }
+
+                for index, login in enumerate(logins):
+                    alias = f"u{index}"
+                    user = data.get(alias)
+                    if user is None:
+                        # Bots and deleted accounts have no user profile
+                        if alias in not_found:
+                            profiles[login] = None
+                        continue
+
+                    profiles[login] = {
+                        "followers": user["followers"]["totalCount"],
+                        "company": user.get("company"),
+                        "github_star": user.get("isGitHubStar", False),
+                    }
+        except Exception as e:
+            logger.error(f"Exception while fetching user profiles: {e}")
+
+        return profiles
+
+    async def get_open_issue_counts(self, repo_full_names):
+        """Fetch open issue counts for several repositories in a single GraphQL request."""
+        await self.start_session()
+
+        counts = {}
+        if not repo_full_names:
+            return counts
+
+        # open_issues_count in the REST API also counts open pull requests
+        variables = {}
+        selections = []
+        for index, full_name in enumerate(repo_full_names):
+            owner, name = full_name.split("/", 1)
+            variables[f"o{index}"] = owner
+            variables[f"n{index}"] = name
+            selections.append(
+                f"r{index}: repository(owner: $o{index}, name: $n{index}) "
+                "{ issues(states: OPEN) { totalCount } }"
+            )
+        definitions = ", ".join(f"${name}: String!" for name in variables)
+        query = f"query({definitions}) {{ {' '.join(selections)} }}"
+
+        try:
+            async with self.session.post(
+                Config.GITHUB_GRAPHQL_URL,
+                headers=self.headers,
+                json={"query": query, "variables": variables},
+            ) as response:
+                if response.status != 200:
+                    logger.error(
+                        f"Error fetching open issue counts: {response.status} - {await response.text()}"
+                    )
+                    return counts
+
+                result = await response.json()
+                data = result.get("data")
+                if data is None:
+                    logger.error(
+                        f"Error fetching open issue counts: {result.get('errors')}"
+                    )
+                    return counts
+
+                for index, full_name in enumerate(repo_full_names):
+                    repo = data.get(f"r{index}")
+                    if repo is not None:
+                        counts[full_name] = repo["issues"]["totalCount"]
+        except Exception as e:
+            logger.error(f"Exception while fetching open issue counts: {e}")
+
+        return counts
+
+    def parse_stargazers(self, stargazers_data):
+        """Extract relevant information from a page of stargazers."""
+        return [
+            {
+                "username": user["login"],
+                "profile": user["html_url"],
+                "avatar": user["avatar_url"],
+            }
+            for user in stargazers_data
+        ]
+
+    def parse_release(self, release):
+        """Extract relevant information from a release."""
+        return {
+            "tag": release["tag_name"],
+            "name": release.get("name") or release["tag_name"],
+            "url": release["html_url"],
+            "published_at": release.get("published_at"),
+        }
+
     def parse_repository_data(self, repositories):
         """Extract relevant information from repositories."""
         parsed_data = []
@@ -170,23 +363,11 @@ class GitHubAPI:
                     "language": repo.get("language"),
                     "created_at": repo["created_at"],
                     "updated_at": repo["updated_at"],
-                    "stargazers": [],  # Initialize empty stargazers list
                 }
             )
 
         return parsed_data
 
-    async def update_stargazers_for_repos(self, repositories):
-        """Update the stargazers list for each repository."""
-        for repo in repositories:
-            stargazers = await self.get_all_stargazers(repo["full_name"])
-            repo["stargazers"] = stargazers
-            logger.info(
-                f"Updated stargazers for {repo['full_name']}: {len(stargazers)} users"
-            )
-
-        return repositories
-
     async def save_repositories_data(self, repositories):
         """Save repositories data to JSON file."""
         try:
@@ -211,72 +392,3 @@ class GitHubAPI:
         except Exception as e:
             logger.error(f"Failed to load repositories data: {e}")
             return []
-
-    def compare_stars(self, old_repos, new_repos):
-        """Compare star counts between old and new repository data."""
-        changes = []
-
-        # Create a lookup dictionary for fast access
-        old_repos_dict = {repo["id"]: repo for repo in old_repos}
-
-        for new_repo in new_repos:
-            repo_id = new_repo["id"]
-
-            if repo_id in old_repos_dict:
-                old_repo = old_repos_dict[repo_id]
-                old_stars = old_repo["stars"]
-                new_stars = new_repo["stars"]
-
-                # Get stargazers from old repository data
-                old_stargazers = old_repo.get("stargazers", [])
-                new_stargazers = new_repo.get("stargazers", [])
-
-                # Create username sets for easier comparison
-                old_usernames = {user["username"] for user in old_stargazers}
-                new_usernames = {user["username"] for user in new_stargazers}
-
-                if new_stars > old_stars:
-                    # Find users who added stars
-                    added_users = new_usernames - old_usernames
-                    added_stargazers = [
-                        user
-                        for user in new_stargazers
-                        if user["username"] in added_users
-                    ]
-
-                    changes.append(
-                        {
-                            "type": "added",
-                            "repo": new_repo,
-                            "old_stars": old_stars,
-                            "new_stars": new_stars,
-                            "difference": new_stars - old_stars,
-                            "users": added_stargazers,
-                        }
-                    )
-                elif new_stars < old_stars:
-                    # Find users who removed stars
-                    removed_users = old_usernames - new_usernames
-                    removed_stargazers = [
-                        user
-                        for user in old_stargazers
-                        if user["username"] in removed_users
-                    ]
-
-                    changes.append(
-                        {
-                            "type": "removed",
-                            "repo": new_repo,
-                            "old_stars": old_stars,
-                            "new_stars": new_stars,
-                            "difference": old_stars - new_stars,
-                            "users": removed_stargazers,
-                        }
-                    )
-            else:
-                # New repository
-                changes.append(
-                    {"type": "new", "repo": new_repo, "stars": new_repo["stars"]}
-                )
-
-        return changes
@@ -0,0 +1,250 @@
+import asyncio
+from config.config import Config
+from utils.logger import setup_logger
+
+logger = setup_logger("metrics")
+
+
+class TrackedMetric:
+    def __init__(
+        self, name, key, label, emoji, diff, fetcher=None, fields=None, batch=False
+    ):
+        self.name = name
+        # Repository field compared between cycles
+        self.key = key
+        self.label = label
+        self.emoji = emoji
+        # diff(key, old_repo, new_repo) returns a partial change dict or None
+        self.diff = diff
+        # fetcher(github_api, repo) returns fields to merge into the repo, or
+        # None when the fetch failed; metrics without one use the repo listing.
+        # Batch fetchers take the list of repos and return fields by repo id,
+        # leaving out the repos they failed to fetch
+        self.fetcher = fetcher
+        self.batch = batch
+        # Fields the fetcher fills in, kept from the previous cycle when not fetched
+        self.fields = fields or [key]
+
+    def compare(self, old_repo, new_repo):
+        """Return the change of this metric between two snapshots of a repository."""
+        # Data saved before the metric was tracked has nothing to compare against
+        if self.key not in old_repo or self.key not in new_repo:
+            return None
+
+        change = self.diff(self.key, old_repo, new_repo)
+        if change:
+            change["metric"] = self
+            change["repo"] = new_repo
+        return change
+
+
+def diff_count(key, old_repo, new_repo):
+    """Report an increase or decrease of a counter."""
+    old_value = old_repo[key]
+    new_value = new_repo[key]
+
+    if new_value == old_value:
+        return None
+
+    return {
+        "type": "added" if new_value > old_value else "removed",
+        "old_value": old_value,
+        "new_value": new_value,
+        "difference": abs(new_value - old_value),
+    }
+
+
+def diff_stars(key, old_repo, new_repo):
+    """Report a star count change along with the users who starred or unstarred."""
+    change = diff_count(key, old_repo, new_repo)
+    if not change:
+        return None
+
+    # Get stargazers from old repository data
+    old_stargazers = old_repo.get("stargazers", [])
+    new_stargazers = new_repo.get("stargazers", [])
+
+    change["old_stars"] = change["old_value"]
+    change["new_stars"] = change["new_value"]
+    change["users"] = []
+
+    # Without a previous stargazer list every current stargazer would look new
+    if not old_stargazers and change["old_value"] > 0:
+        return change
+
+    # Create username sets for easier comparison
+    old_usernames = {user["username"] for user in old_stargazers}
+    new_usernames = {user["username"] for user in new_stargazers}
+
+    if change["type"] == "added":
+        # Find users who added stars
+        added_users = new_usernames - old_usernames
+        users = [user for user in new_stargazers if user["username"] in added_users]
+    else:
+        # Find users who removed stars
+        removed_users = old_usernames - new_usernames
+        users = [user for user in old_stargazers if user["username"] in removed_users]
+
+    change["users"] = users
+    return change
+
+
+def diff_release(key, old_repo, new_repo):
+    """Report a release that was not the latest one during the previous cycle."""
+    old_release = old_repo[key]
+    new_release = new_repo[key]
+
+    if not new_release:
+        return None
+    if old_release and old_release["tag"] == new_release["tag"]:
+        return None
+
+    return {"type": "released", "release": new_release}
+
+
+async def fetch_stargazers(github_api, repo):
+    """Fetch every stargazer of a repository."""
+    stargazers = await github_api.get_all_stargazers(repo["full_name"])
+    if stargazers is None:
+        return None
+    logger.info(f"Updated stargazers for {repo['full_name']}: {len(stargazers)} users")
+    return {"stargazers": stargazers}
+
+
+async def fetch_watchers(github_api, repo):
+    """Fetch the watcher count, which the repository listing doesn't include."""
+    watchers = await github_api.get_watcher_count(repo["full_name"])
+    if watchers is None:
+        return None
+    return {"watchers": watchers}
+
+
+async def fetch_open_issues(github_api, repos):
+    """Fetch open issue counts, excluding pull requests, for all repositories."""
+    counts = {}
+    for start in range(0, len(repos), Config.METRIC_BATCH_SIZE):
+        batch = repos[start : start + Config.METRIC_BATCH_SIZE]
+        counts.update(
+            await github_api.get_open_issue_counts([repo["full_name"] for repo in batch])
+        )
+
+    return {
+        repo["id"]: {"issues": counts[repo["full_name"]]}
+        for repo in repos
+        if repo["full_name"] in counts
+    }
+
+
+async def fetch_latest_release(github_api, repo):
+    """Fetch the latest release of a repository."""
+    release = await github_api.get_latest_release(repo["full_name"])
+    if release is None:
+        return None
+    return {"latest_release": release or None}
+
+
+METRICS = [
+    TrackedMetric(
+        "stars", "stars", "Stars", "⭐", diff_stars, fetch_stargazers, ["stargazers"]
+    ),
+    TrackedMetric("forks", "forks", "Forks", "🍴", diff_count),
+    TrackedMetric("watchers", "watchers", "Watchers", "👀", diff_count, fetch_watchers),
+    TrackedMetric(
+        "open_issues", "issues", "Open Issues", "🐛", diff_count, fetch_open_issues,
+        batch=True,
+    ),
+    TrackedMetric(
+        "releases", "latest_release", "Releases", "🚀", diff_release, fetch_latest_release
+    ),
+]
+
+
+class MetricEngine:
+    def __init__(self, github_api, metric_names=None):
+        self.github_api = github_api
+
+        metric_names = metric_names or Config.TRACKED_METRICS
+        known_names = [metric.name for metric in METRICS]
+
+        unknown_names = [name for name in metric_names if name not in known_names]
+        if unknown_names:
+            logger.warning(
+                f"Ignoring unknown metrics: {', '.join(unknown_names)} "
+                f"(available: {', '.join(known_names)})"
+            )
+
+        self.metrics = [metric for metric in METRICS if metric.name in metric_names]
+        if not self.metrics:
+            logger.warning("No valid metrics configured, tracking all metrics")
+            self.metrics = list(METRICS)
+
+        logger.info(
+            f"Tracking metrics: {', '.join(metric.name for metric in self.metrics)}"
+        )
+
+    async def collect(self, raw_repos, old_repos=None):
+        """Build repository data with every tracked metric from one repository listing."""
+        repos = self.github_api.parse_repository_data(raw_repos)
+
+        old_repos_dict = {repo["id"]: repo for repo in old_repos or []}
+        semaphore = asyncio.Semaphore(Config.METRIC_FETCH_CONCURRENCY)
+
+        async def fetch(metric, repo):
+            async with semaphore:
+                fields = await metric.fetcher(self.github_api, repo)
+            if fields is not None:
+                repo.update(fields)
+
+        async def fetch_batch(metric):
+            fields_by_id = await metric.fetcher(self.github_api, repos)
+            for repo in repos:
+                repo.update(fields_by_id.get(repo["id"], {}))
+
+        fetches = []
+        for metric in self.metrics:
+            if metric.batch:
+                fetches.append(fetch_batch(metric))
+            elif metric.fetcher:
+                fetches.extend(fetch(metric, repo) for repo in repos)
+        await asyncio.gather(*fetches)
+
+        # Keep previous values of fields that failed or weren't fetched this
+        # cycle, so they are neither reported as changes nor lost when saving
+        for repo in repos:
+            old_repo = old_repos_dict.get(repo["id"])
+            if old_repo is None:
+                continue
+
+            for metric in METRICS:
+                if not metric.fetcher:
+                    continue
+
+                for field in metric.fields:
+                    if field not in repo and field in old_repo:
+                        repo[field] = old_repo[field]
+
+        return repos
+
+    def compare(self, old_repos, new_repos):
+        """Compare every tracked metric between old and new repository data."""
+        changes = []
+
+        # Create a lookup dictionary for fast access
+        old_repos_dict = {repo["id"]: repo for repo in old_repos}
+
+        for new_repo in new_repos:
+            old_repo = old_repos_dict.get(new_repo["id"])
+
+            if old_repo is None:
+                # New repository
+                changes.append(
+                    {"type": "new", "repo": new_repo, "stars": new_repo["stars"]}
+                )
+                continue
+
+            for metric in self.metrics:
+                change = metric.compare(old_repo, new_repo)
+                if change:
+                    changes.append(change)
+
+        return changes
@@ -0,0 +1,158 @@
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from config.config import Config
+from utils.logger import setup_logger
+
+logger = setup_logger("profile_enricher")
+
+
+class ProfileEnricher:
+    def __init__(self, github_api):
+        self.github_api = github_api
+
+        # Login -> {"profile": dict or None, "fetched_at": timestamp}, oldest first
+        self.cache = OrderedDict()
+
+        # Logins waiting for the next batch, each with the future awaiting it
+        self.pending = {}
+        self.flush_task = None
+
+        # Logins whose batch request is running, kept until their result is set
+        self.in_flight = {}
+
+        self.load_cache()
+
+    def get_cached(self, logins):
+        """Return fresh cached profiles for the given logins, skipping misses."""
+        now = time.time()
+        profiles = {}
+
+        for login in logins:
+            entry = self.cache.get(login)
+            if entry is None:
+                continue
+
+            if now - entry["fetched_at"] > Config.PROFILE_CACHE_TTL:
+                del self.cache[login]
+                continue
+
+            # Mark as recently used
+            self.cache.move_to_end(login)
+            profiles[login] = entry["profile"]
+
+        return profiles
+
+    async def get_profiles(self, logins):
+        """Get profiles for the given logins, batching any cache misses."""
+        profiles = self.get_cached(logins)
+
+        futures = []
+        for login in logins:
+            if login in profiles:
+                continue
+
+            # Reuse the lookup if another notification already asked
+            if login in self.in_flight:
+                futures.append((login, self.in_flight[login]))
+                continue
+            if login not in self.pending:
+                self.pending[login] = asyncio.get_running_loop().create_future()
+            futures.append((login, self.pending[login]))
+
+        if self.pending and self.flush_task is None:
+            self.flush_task = asyncio.create_task(self.flush_pending())
+
+        for login, future in futures:
+            profiles[login] = await future
+
+        return profiles
+
+    async def flush_pending(self):
+        """Fetch all pending logins in batches once the collection window closes."""
+        # Give bursts of notifications time to join the same batch
+        await asyncio.sleep(Config.PROFILE_BATCH_DELAY)
+
+        pending, self.pending = self.pending, {}
+        self.in_flight.update(pending)
+        self.flush_task = None
+
+        try:
+            logins = list(pending)
+            logger.info(f"Fetching {len(logins)} stargazer profile(s)")
+
+            for start in range(0, len(logins), Config.PROFILE_BATCH_SIZE):
+                batch = logins[start : start + Config.PROFILE_BATCH_SIZE]
+                fetched = await self.github_api.get_user_profiles(batch)
+
+                for login in batch:
+                    if login in fetched:
+                        self.store(login, fetched[login])
+                    self.in_flight.pop(login).set_result(fetched.get(login))
+
+            self.save_cache()
+        except Exception as e:
+            logger.error(f"Failed to fetch stargazer profiles: {e}")
+            for login, future in pending.items():
+                self.in_flight.pop(login, None)
+                if not future.done():
+                    future.set_result(None)
+
+    def store(self, login, profile):
+        """Add a profile to the cache, evicting the least recently used entries."""
+        self.cache[login] = {"profile": profile, "fetched_at": time.time()}
+        self.cache.move_to_end(login)
+
+        while len(self.cache) > Config.PROFILE_CACHE_SIZE:
+            self.cache.popitem(last=False)
+
+    def save_cache(self):
+        """Save cached profiles to JSON file."""
+        try:
+            with open(Config.PROFILES_FILE, "w") as file:
+                json.dump({"profiles": self.cache}, file, indent=2)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to save profile cache: {e}")
+            return False
+
+    def load_cache(self):
+        """Load cached profiles from JSON file, dropping expired entries."""
+        try:
+            with open(Config.PROFILES_FILE, "r") as file:
+                data = json.load(file)
+        except FileNotFoundError:
+            logger.info(f"No existing profile cache found at {Config.PROFILES_FILE}")
+            return
+        except Exception as e:
+            logger.error(f"Failed to load profile cache: {e}")
+            return
+
+        now = time.time()
+        for login, entry in data.get("profiles", {}).items():
+            if not self.is_valid_entry(entry):
+                logger.warning(f"Skipping malformed cached profile for {login}")
+                continue
+
+            if now - entry["fetched_at"] <= Config.PROFILE_CACHE_TTL:
+                self.cache[login] = entry
+
+        while len(self.cache) > Config.PROFILE_CACHE_SIZE:
+            self.cache.popitem(last=False)
+
+        logger.info(f"Loaded {len(self.cache)} cached stargazer profiles")
+
+    def is_valid_entry(self, entry):
+        """Check that a persisted cache entry has the shape get_cached relies on."""
+        if not isinstance(entry, dict):
+            return False
+        if not isinstance(entry.get("fetched_at"), (int, float)):
+            return False
+        if "profile" not in entry:
+            return False
+
+        profile = entry["profile"]
+        return profile is None or (
+            isinstance(profile, dict) and isinstance(profile.get("followers"), int)
+        )
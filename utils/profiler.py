@@ -0,0 +1,164 @@
+import asyncio
+import cProfile
+import datetime
+import io
+import os
+import pstats
+import sys
+import tracemalloc
+from utils.logger import setup_logger
+
+logger = setup_logger("profiler")
+
+
+def deep_sizeof(obj, seen=None):
+    """Estimate the memory used by an object and everything it contains."""
+    if seen is None:
+        seen = set()
+
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            size += deep_sizeof(key, seen) + deep_sizeof(value, seen)
+    elif isinstance(obj, (list, tuple, set)):
+        for item in obj:
+            size += deep_sizeof(item, seen)
+
+    return size
+
+
+class MonitorProfiler:
+    def __init__(self):
+        # Number of monitor cycles still to profile; zero means disabled
+        self.remaining_cycles = 0
+        self.profile = None
+        self.snapshot = None
+        self.started_tracemalloc = False
+
+    def request(self, cycles):
+        """Profile and trace memory for the next given number of cycles."""
+        if cycles < 1:
+            logger.warning(f"Ignoring profiling request for {cycles} cycle(s)")
+            return
+
+        self.remaining_cycles = cycles
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.started_tracemalloc = True
+        logger.info(f"Profiling requested for the next {cycles} monitor cycle(s)")
+
+    def start_cycle(self):
+        """Start profiling a monitor cycle if profiling was requested."""
+        if not self.remaining_cycles or self.profile is not None:
+            return
+
+        if self.snapshot is None:
+            self.snapshot = tracemalloc.take_snapshot().filter_traces(
+                [tracemalloc.Filter(False, tracemalloc.__file__)]
+            )
+
+        self.profile = cProfile.Profile()
+        self.profile.enable()
+
+    def end_cycle(self, **structures):
+        """Stop profiling a monitor cycle and write its reports under logs/."""
+        if self.profile is None:
+            return
+
+        self.profile.disable()
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+
+        try:
+            self.write_profile(timestamp)
+            self.write_memory_report(timestamp, structures)
+        except Exception as e:
+            logger.error(f"Failed to write profiling reports: {e}")
+
+        self.profile = None
+        self.remaining_cycles -= 1
+        if not self.remaining_cycles:
+            self.stop()
+
+    def stop(self):
+        """Stop profiling and release any tracing state."""
+        self.remaining_cycles = 0
+        self.snapshot = None
+        if self.started_tracemalloc:
+            tracemalloc.stop()
+            self.started_tracemalloc = False
+        logger.info("Profiling finished")
+
+    def shutdown(self):
+        """Stop any profiling in progress without writing reports."""
+        if self.profile is not None:
+            self.profile.disable()
+            self.profile = None
+
+        if self.remaining_cycles or self.started_tracemalloc:
+            self.stop()
+
+    def write_profile(self, timestamp):
+        """Write the raw cProfile stats and a readable summary of the cycle."""
+        # The event loop is shared, so other tasks running during the cycle
+        # (such as the Discord client) show up in the profile as well
+        base = os.path.join("logs", f"profile_{timestamp}")
+        self.profile.dump_stats(f"{base}.prof")
+
+        summary = io.StringIO()
+        stats = pstats.Stats(self.profile, stream=summary)
+        stats.sort_stats("cumulative").print_stats(50)
+        with open(f"{base}.txt", "w") as file:
+            file.write(summary.getvalue())
+
+        logger.info(f"Wrote cycle profile to {base}.prof")
+
+    def write_memory_report(self, timestamp, structures):
+        """Write a tracemalloc diff against the previous cycle and structure sizes."""
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, tracemalloc.__file__)]
+        )
+        path = os.path.join("logs", f"tracemalloc_{timestamp}.txt")
+
+        with open(path, "w") as file:
+            file.write("Monitor data structures\n")
+            for name, repos in structures.items():
+                if repos is None:
+                    continue
+                stargazers = sum(len(repo.get("stargazers", [])) for repo in repos)
+                stargazer_size = sum(
+                    deep_sizeof(repo.get("stargazers", [])) for repo in repos
+                )
+                file.write(
+                    f"{name}: {len(repos)} repositories, ~{deep_sizeof(repos)} bytes, "
+                    f"{stargazers} stargazers (~{stargazer_size} bytes)\n"
+                )
+
+            current, peak = tracemalloc.get_traced_memory()
+            file.write(f"\nTraced memory: {current} bytes (peak {peak} bytes)\n")
+
+            file.write("\nTop allocation changes since the previous cycle\n")
+            for stat in snapshot.compare_to(self.snapshot, "lineno")[:30]:
+                file.write(f"{stat}\n")
+
+        self.snapshot = snapshot
+        logger.info(f"Wrote memory report to {path}")
+
+    def dump_tasks(self):
+        """Write the stack of every running asyncio task under logs/."""
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        path = os.path.join("logs", f"tasks_{timestamp}.txt")
+
+        tasks = asyncio.all_tasks()
+        with open(path, "w") as file:
+            file.write(f"{len(tasks)} running task(s)\n\n")
+            for task in tasks:
+                file.write(f"{task!r}\n")
+                task.print_stack(file=file)
+                file.write("\n")
+
+        logger.info(f"Wrote {len(tasks)} task stacks to {path}")
+        return path